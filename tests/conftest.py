@@ -1,3 +1,4 @@
+import functools
 import sys
 from pathlib import Path
 
@@ -6,28 +7,169 @@ _project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(_project_root / "src"))
 
 import datetime  # noqa: E402
+from decimal import Decimal  # noqa: E402
 from enum import Enum, IntEnum  # noqa: E402
-from typing import List, Literal, Optional  # noqa: E402
+from types import MappingProxyType  # noqa: E402
+from typing import Any, Dict, List, Literal, Optional  # noqa: E402
+from uuid import uuid4  # noqa: E402
 
+import bs4  # noqa: E402
 import fasthtml.common as fh  # noqa: E402
 import monsterui.all as mui  # noqa: E402
 import pytest  # noqa: E402
-from pydantic import BaseModel, Field, ValidationError  # noqa: E402
+from pydantic import BaseModel, ConfigDict, Field, ValidationError  # noqa: E402
+from pydantic.fields import FieldInfo  # noqa: E402
 from pydantic.json_schema import SkipJsonSchema  # noqa: E402
-from starlette.testclient import TestClient  # noqa: E402
 
 # Remove imports from examples
-from fh_pydantic_form import PydanticForm, list_manipulation_js  # noqa: E402
+from fh_pydantic_form import (  # noqa: E402
+    ComparisonForm,
+    PydanticForm,
+    list_manipulation_js,
+)
+
+# Header components are pure, so build them once and share across all apps
+_BLUE_HDRS = mui.Theme.blue.headers()
+_SHARED_HDRS = (_BLUE_HDRS, list_manipulation_js())
+
+
+@functools.cache
+def _test_client_cls():
+    """
+    Import Starlette's TestClient on first use. fasthtml and monsterui come in
+    with fh_pydantic_form anyway, but httpx is only needed by client fixtures.
+    """
+    from starlette.testclient import TestClient
+
+    return TestClient
+
+
+# Renderers keyed by form name and options, so each model's schema is walked
+# once per session rather than once per fixture. Every fixture uses its own
+# form name, so initial_values is not part of the key.
+_FORM_CACHE: dict[tuple, PydanticForm] = {}
+
+
+def _get_form(
+    form_name: str,
+    model_class: type[BaseModel],
+    *,
+    initial_values: Any = None,
+    disabled: bool = False,
+    disabled_fields: Optional[List[str]] = None,
+) -> PydanticForm:
+    """Return the cached PydanticForm for these arguments, building it once."""
+    key = (
+        model_class,
+        form_name,
+        disabled,
+        tuple(sorted(disabled_fields)) if disabled_fields else None,
+    )
+    form = _FORM_CACHE.get(key)
+    if form is None:
+        form = _FORM_CACHE[key] = PydanticForm(
+            form_name,
+            model_class,
+            initial_values=initial_values,
+            disabled=disabled,
+            disabled_fields=disabled_fields,
+        )
+    return form
+
+
+@pytest.fixture(autouse=True)
+def _reset_cached_forms():
+    """Rewind cached forms so a refresh in one test doesn't leak into the next."""
+    for form in _FORM_CACHE.values():
+        form.reset_state()
+
+
+# Started TestClients keyed by (app, base path); closed at session end
+_CLIENT_CACHE: dict[tuple[int, str], Any] = {}
+
+
+def _client_for(app, prefix: str = ""):
+    """Return the TestClient for ``app`` under ``prefix``, starting it once."""
+    key = (id(app), prefix)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _test_client_cls()(
+            app, base_url=f"http://testserver{prefix}", backend="asyncio"
+        )
+        client.__enter__()
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _close_cached_clients():
+    """Shut down every cached TestClient once the session is over."""
+    yield
+    while _CLIENT_CACHE:
+        _, client = _CLIENT_CACHE.popitem()
+        client.__exit__(None, None, None)
+
+
+class _PrefixedRoutes:
+    """
+    Route registrar that mounts one fixture's routes under ``prefix`` on the
+    shared app. It works both as ``rt`` and as the ``app`` passed to
+    ``register_routes``, so a fixture's page, submit and list routes all move
+    together and its client can keep using un-prefixed paths.
+    """
+
+    def __init__(self, app, prefix: str):
+        self.app = app
+        self.prefix = prefix
+
+    def route(self, path: str, methods=None):
+        return self.app.route(self.prefix + path, methods=methods)
+
+    __call__ = route
+
+    def client(self):
+        """Return the shared TestClient whose relative URLs resolve under this prefix."""
+        return _client_for(self.app, self.prefix)
+
+
+# Card headers are identical on every response, so share the FT nodes
+_SUCCESS_HEADER = mui.CardHeader(fh.H3("Validation Successful"))
+_ERROR_HEADER = mui.CardHeader(fh.H3("Validation Error", cls="text-red-500"))
+
+
+def _make_submit_handler(form_renderer: PydanticForm):
+    """Build the /submit_form handler that validates and echoes the model."""
+
+    async def post_main_form(req):
+        try:
+            validated = await form_renderer.model_validate_request(req)
+            return mui.Card(
+                _SUCCESS_HEADER,
+                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
+            )
+        except ValidationError as e:
+            return mui.Card(
+                _ERROR_HEADER,
+                mui.CardBody(fh.Pre(e.json(indent=2))),
+            )
+
+    return post_main_form
+
+
+@pytest.fixture(scope="session")
+def shared_app():
+    """Single FastHTML app that every form client fixture registers routes on."""
+    app, _ = fh.fast_app(hdrs=_SHARED_HDRS, pico=False)
+    return app
 
 
 # --- E2E ComparisonForm fixture ---
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def comparison_app_client():
     """
     Returns (client, comp) where client is a TestClient running a
     minimal FastHTML app with a ComparisonForm already registered.
     """
-    from fh_pydantic_form.comparison_form import ComparisonForm
 
     class RenderTestModel(BaseModel):
         title: str = "Default Title"
@@ -41,14 +183,14 @@ def comparison_app_client():
     )
     comp = ComparisonForm("e2e_test", left, right)
 
-    app, rt = fh.fast_app(hdrs=[mui.Theme.blue.headers()], pico=False, live=False)
+    app, rt = fh.fast_app(hdrs=(_BLUE_HDRS,), pico=False)
     comp.register_routes(app)  # comparison + underlying forms
 
     @rt("/")  # landing page so TestClient can fetch HTML if wanted
     def _root():
         return comp.form_wrapper(comp.render_inputs())
 
-    return TestClient(app), comp
+    return _client_for(app), comp
 
 
 # Define test Enum classes
@@ -77,6 +219,15 @@ class ShippingMethod(Enum):
     OVERNIGHT = "OVERNIGHT"
 
 
+# Fixed date/time defaults for the Complex* schemas, so instances built without
+# them are deterministic and don't read the clock
+_TEST_CREATION_DATE = datetime.date(2024, 1, 1)
+_TEST_START_TIME = datetime.time(12, 0, 0)
+
+# Address kind labels, indexed by the ``is_billing`` bool
+_BILLING = ("shipping", "billing")
+
+
 # Define test-specific Address model
 class AddressTestModel(BaseModel):
     street: str = "123 Main St"
@@ -84,7 +235,7 @@ class AddressTestModel(BaseModel):
     is_billing: bool = False
 
     def __str__(self) -> str:
-        return f"{self.street}, {self.city} ({'billing' if self.is_billing else 'shipping'})"
+        return f"{self.street}, {self.city} ({_BILLING[self.is_billing]})"
 
 
 # Define Address model with tags for nested list testing
@@ -95,8 +246,8 @@ class AddressWithTagsTestModel(BaseModel):
     tags: List[str] = Field(default_factory=list, description="Tags for the address")
 
     def __str__(self) -> str:
-        tag_str = ", ".join(self.tags) if self.tags else "no tags"
-        return f"{self.street}, {self.city} ({tag_str}) ({'billing' if self.is_billing else 'shipping'})"
+        tag_str = ", ".join(self.tags) or "no tags"
+        return f"{self.street}, {self.city} ({tag_str}) ({_BILLING[self.is_billing]})"
 
 
 # Define test-specific CustomDetail model
@@ -114,6 +265,8 @@ class ComplexTestSchema(BaseModel):
     Test model mirroring the structure of ComplexSchema from examples
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(description="Name of the customer")
     age: int = Field(description="Age of the customer")
     score: float = Field(description="Score of the customer")
@@ -122,11 +275,10 @@ class ComplexTestSchema(BaseModel):
 
     # Date and time fields
     creation_date: datetime.date = Field(
-        default_factory=datetime.date.today, description="Creation date of the customer"
+        default=_TEST_CREATION_DATE, description="Creation date of the customer"
     )
     start_time: datetime.time = Field(
-        default_factory=lambda: datetime.datetime.now().time().replace(microsecond=0),
-        description="Start time of the customer",
+        default=_TEST_START_TIME, description="Start time of the customer"
     )
 
     # Literal/enum field
@@ -166,6 +318,8 @@ class ComplexNestedTestSchema(BaseModel):
     Test model with nested list support - addresses that contain tags
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(description="Name of the customer")
     age: int = Field(description="Age of the customer")
     score: float = Field(description="Score of the customer")
@@ -174,11 +328,10 @@ class ComplexNestedTestSchema(BaseModel):
 
     # Date and time fields
     creation_date: datetime.date = Field(
-        default_factory=datetime.date.today, description="Creation date of the customer"
+        default=_TEST_CREATION_DATE, description="Creation date of the customer"
     )
     start_time: datetime.time = Field(
-        default_factory=lambda: datetime.datetime.now().time().replace(microsecond=0),
-        description="Start time of the customer",
+        default=_TEST_START_TIME, description="Start time of the customer"
     )
 
     # Literal/enum field
@@ -231,6 +384,18 @@ class ListTestModel(BaseModel):
     tags: List[str] = Field(["tag1", "tag2"])
 
 
+# Nested models backing the nested_test_model fixture
+class NestedTestModel(BaseModel):
+    sub_field: str = "Default Sub"
+    is_active: bool = False
+
+
+class NestedParentTestModel(BaseModel):
+    name: str = "Parent Model"
+    count: Optional[int] = None
+    nested: NestedTestModel = Field(default_factory=NestedTestModel)
+
+
 # Define Enum test models
 class EnumTestModel(BaseModel):
     """Simple enum test model for fixtures."""
@@ -243,6 +408,8 @@ class EnumTestModel(BaseModel):
 class ComplexEnumTestModel(BaseModel):
     """Complex enum test model with various enum field types."""
 
+    model_config = ConfigDict(defer_build=True)
+
     # Required enum fields
     status: OrderStatus = OrderStatus.NEW
     shipping_method: ShippingMethod = ShippingMethod.STANDARD
@@ -259,150 +426,341 @@ class ComplexEnumTestModel(BaseModel):
     available_priorities: List[Priority] = Field(default_factory=list)
 
 
-@pytest.fixture(scope="module")
-def simple_client():
-    """TestClient for a simple form defined locally."""
+# Define list-item models outside of fixtures so their schemas are built once,
+# and only when a test first validates against them
+class InnerModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
 
-    form_renderer = PydanticForm("test_simple", SimpleTestModel)
-    app, rt = fh.fast_app(hdrs=[mui.Theme.blue.headers()], pico=False, live=False)
+    inner_name: str
+    inner_value: int = 10
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Simple Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(form_renderer.render_inputs(), id="test-simple-form")
-                    ),
-                ),
-            ),
-        )
+    def __str__(self) -> str:
+        return f"Inner: {self.inner_name}"
 
-    return TestClient(app)
 
+class NestedItemModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
 
-@pytest.fixture(scope="module")
-def globally_disabled_simple_client():
-    """TestClient for a simple form with all fields disabled."""
+    name: str
+    inner: InnerModel
 
-    form_renderer = PydanticForm(
-        "test_simple_globally_disabled", SimpleTestModel, disabled=True
-    )
-    app, rt = fh.fast_app(hdrs=[mui.Theme.blue.headers()], pico=False, live=False)
+    def __str__(self) -> str:
+        return f"{self.name} -> {self.inner}"
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Simple Test Form (Globally Disabled)"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            id="test-simple-globally-disabled-form",
-                        )
-                    ),
-                ),
-            ),
-        )
 
-    return TestClient(app)
+class NestedListModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
 
+    title: str = "Nested List"
+    items: List[NestedItemModel] = Field(default_factory=list)
 
-@pytest.fixture(scope="module")
-def partially_disabled_simple_client():
-    """TestClient for a simple form with only the age field disabled."""
 
-    form_renderer = PydanticForm(
-        "test_simple_partially_disabled", SimpleTestModel, disabled_fields=["age"]
-    )
-    app, rt = fh.fast_app(hdrs=[mui.Theme.blue.headers()], pico=False, live=False)
+class DateTimeItemModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Simple Test Form (Partially Disabled)"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            id="test-simple-partially-disabled-form",
-                        )
-                    ),
-                ),
-            ),
-        )
+    name: str
+    created_date: datetime.date
+    start_time: datetime.time
+    optional_date: Optional[datetime.date]
 
-    return TestClient(app)
+    def __str__(self) -> str:
+        return f"{self.name} ({self.created_date})"
 
 
-@pytest.fixture(scope="module")
-def validation_client():
-    """TestClient for a validation form defined locally."""
-    from pydantic import ValidationError
+class DateTimeListModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
 
-    form_renderer = PydanticForm("test_validation", SimpleTestModel)
-    app, rt = fh.fast_app(hdrs=[mui.Theme.blue.headers()], pico=False, live=False)
+    title: str = "DateTime List"
+    items: List[DateTimeItemModel] = Field(default_factory=list)
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.Card(
-                    mui.CardHeader("Validate Test Form"),
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            mui.Button(
-                                "Submit", type="submit", cls=mui.ButtonT.primary
-                            ),
-                            hx_post="/submit_form",
-                            hx_target="#result",
-                            hx_swap="innerHTML",
-                            id="test-validation-form",
-                        )
+
+class UserDefaultItemModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str
+    value: str
+    count: int
+
+    @classmethod
+    def default(cls):
+        return cls(name="User Default Name", value="User Default Value", count=42)
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.value} (x{self.count})"
+
+
+class UserDefaultListModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = "User Default List"
+    items: List[UserDefaultItemModel] = Field(default_factory=list)
+
+
+class SimpleListModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str = "Test Model"
+    tags: List[str] = Field(default_factory=list)
+
+
+class AddressModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    street: str
+    city: str
+    is_billing: bool = False
+
+    def __str__(self) -> str:
+        return f"{self.street}, {self.city} ({_BILLING[self.is_billing]})"
+
+
+class AddressListModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str = "Address List"
+    addresses: List[AddressModel] = Field(default_factory=list)
+
+
+class CustomItemModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str = "Default Item"
+    value: str = "Default Value"
+    priority: int = 1
+    is_active: bool = True
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.value}"
+
+
+class CustomListModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = "Custom List"
+    items: List[CustomItemModel] = Field(default_factory=list)
+
+
+class OptionalItemModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str  # Required field
+    description: Optional[str]  # Optional field without default
+    nickname: Optional[str] = "Default Nick"  # Optional field with default
+    score: Optional[int]  # Optional field without default
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.nickname or 'no nickname'})"
+
+
+class OptionalListModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = "Optional List"
+    items: List[OptionalItemModel] = Field(default_factory=list)
+
+
+class LiteralItemModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str
+    status: Literal["PENDING", "ACTIVE", "COMPLETED"]
+    priority: Optional[Literal["HIGH", "MEDIUM", "LOW"]]
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.status})"
+
+
+class LiteralListModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = "Literal List"
+    items: List[LiteralItemModel] = Field(default_factory=list)
+
+
+# Initial values are statically known-good, so build them once at import and
+# skip validation with model_construct
+_COMPLEX_INITIAL = ComplexTestSchema.model_construct(
+    name="Test User",
+    age=30,
+    score=95.0,
+    is_active=True,
+    description="Test description",
+    creation_date=datetime.date(2023, 1, 1),
+    start_time=datetime.time(12, 0, 0),
+    status="PENDING",
+    optional_status=None,
+    tags=["test1", "test2"],
+    main_address=AddressTestModel.model_construct(
+        street="123 Test St", city="Testville", is_billing=True
+    ),
+    custom_detail=CustomDetailTestModel.model_construct(
+        value="Test Detail", confidence="HIGH"
+    ),
+    other_addresses=[
+        AddressTestModel.model_construct(
+            street="456 Other St", city="Otherville", is_billing=False
+        ),
+    ],
+    more_custom_details=[
+        CustomDetailTestModel.model_construct(
+            value="Test Detail 1", confidence="MEDIUM"
+        ),
+    ],
+)
+
+_COMPLEX_ENUM_INITIAL = ComplexEnumTestModel.model_construct(
+    status=OrderStatus.PROCESSING,
+    shipping_method=ShippingMethod.EXPRESS,
+    priority=Priority.HIGH,
+    name="Test Complex Order",
+    order_id=12345,
+    status_history=[OrderStatus.NEW, OrderStatus.PROCESSING],
+    available_priorities=[Priority.LOW, Priority.MEDIUM],
+)
+
+_COMPLEX_NESTED_INITIAL = ComplexNestedTestSchema.model_construct(
+    name="Nested Test User",
+    age=35,
+    score=92.0,
+    is_active=True,
+    description="Testing nested lists",
+    creation_date=datetime.date(2023, 1, 1),
+    start_time=datetime.time(12, 0, 0),
+    status="PENDING",
+    optional_status=None,
+    tags=["customer", "test"],
+    main_address=AddressWithTagsTestModel.model_construct(
+        street="123 Main St",
+        city="Test City",
+        is_billing=True,
+        tags=["home", "primary"],
+    ),
+    custom_detail=CustomDetailTestModel.model_construct(
+        value="Nested Detail", confidence="HIGH"
+    ),
+    other_addresses=[
+        AddressWithTagsTestModel.model_construct(
+            street="456 Other St",
+            city="Other City",
+            is_billing=False,
+            tags=["work", "backup"],
+        ),
+    ],
+    more_custom_details=[
+        CustomDetailTestModel.model_construct(
+            value="More Nested Detail", confidence="MEDIUM"
+        ),
+    ],
+)
+
+
+def _form_page_client(
+    app,
+    form_name: str,
+    model_class,
+    heading,
+    *,
+    submit: bool = False,
+    form_id: Optional[str] = None,
+    **form_kwargs,
+):
+    """
+    Serve a form page for ``model_class`` under /<form_name>, with its list and
+    action routes, and return its client. With ``submit`` the form gets a
+    Submit button posting to /submit_form and a #result target. ``form_kwargs``
+    go to the renderer.
+    """
+    form_renderer = _get_form(form_name, model_class, **form_kwargs)
+    rt = _PrefixedRoutes(app, f"/{form_name}")
+    form_renderer.register_routes(rt)
+    form_id = form_id or f"{form_name.replace('_', '-')}-form"
+
+    if submit:
+        rt("/submit_form", methods=["POST"])(_make_submit_handler(form_renderer))
+
+        def page(inputs):
+            return fh.Div(
+                mui.Container(
+                    heading,
+                    mui.Card(
+                        mui.CardBody(
+                            mui.Form(
+                                inputs,
+                                mui.Button(
+                                    "Submit", type="submit", cls=mui.ButtonT.primary
+                                ),
+                                hx_post="/submit_form",
+                                hx_target="#result",
+                                hx_swap="innerHTML",
+                                id=form_id,
+                            )
+                        ),
                     ),
+                    fh.Div(id="result"),
                 ),
-                fh.Div(id="result"),
-            ),
-        )
-
-    @rt("/submit_form", methods=["POST"])
-    async def post_main_form(req):
-        try:
-            validated = await form_renderer.model_validate_request(req)
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Successful")),
-                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
             )
-        except ValidationError as e:
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Error", cls="text-red-500")),
-                mui.CardBody(fh.Pre(e.json(indent=2))),
+    else:
+
+        def page(inputs):
+            return fh.Div(
+                mui.Container(
+                    heading,
+                    mui.Card(mui.CardBody(mui.Form(inputs, id=form_id))),
+                ),
             )
 
-    return TestClient(app)
+    @rt("/")
+    def get():
+        return page(form_renderer.render_inputs())
 
+    return rt.client()
+
+
+@pytest.fixture(scope="session")
+def simple_client(shared_app):
+    """TestClient for a simple form defined locally."""
+    return _form_page_client(
+        shared_app, "test_simple", SimpleTestModel, mui.CardHeader("Simple Test Form")
+    )
 
-@pytest.fixture(scope="module")
-def list_client():
-    """TestClient for a list form defined locally."""
-    from pydantic import ValidationError
 
-    form_renderer = PydanticForm("test_list", ListTestModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+@pytest.fixture(scope="session")
+def globally_disabled_simple_client(shared_app):
+    """TestClient for a simple form with all fields disabled."""
+    return _form_page_client(
+        shared_app,
+        "test_simple_globally_disabled",
+        SimpleTestModel,
+        mui.CardHeader("Simple Test Form (Globally Disabled)"),
+        disabled=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def partially_disabled_simple_client(shared_app):
+    """TestClient for a simple form with only the age field disabled."""
+    return _form_page_client(
+        shared_app,
+        "test_simple_partially_disabled",
+        SimpleTestModel,
+        mui.CardHeader("Simple Test Form (Partially Disabled)"),
+        disabled_fields=["age"],
     )
-    form_renderer.register_routes(app)  # Register the list routes
+
+
+@pytest.fixture(scope="session")
+def validation_client(shared_app):
+    """TestClient for a validation form defined locally."""
+
+    form_renderer = _get_form("test_validation", SimpleTestModel)
+    rt = _PrefixedRoutes(shared_app, "/test_validation")
 
     @rt("/")
     def get():
         return fh.Div(
             mui.Container(
-                mui.CardHeader(mui.H2("Test List Form")),
                 mui.Card(
+                    mui.CardHeader("Validate Test Form"),
                     mui.CardBody(
                         mui.Form(
                             form_renderer.render_inputs(),
@@ -412,7 +770,7 @@ def list_client():
                             hx_post="/submit_form",
                             hx_target="#result",
                             hx_swap="innerHTML",
-                            id="test-list-form",
+                            id="test-validation-form",
                         )
                     ),
                 ),
@@ -420,34 +778,30 @@ def list_client():
             ),
         )
 
-    @rt("/submit_form", methods=["POST"])
-    async def post_main_form(req):
-        try:
-            validated = await form_renderer.model_validate_request(req)
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Successful")),
-                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
-            )
-        except ValidationError as e:
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Error", cls="text-red-500")),
-                mui.CardBody(fh.Pre(e.json(indent=2))),
-            )
+    rt("/submit_form", methods=["POST"])(_make_submit_handler(form_renderer))
 
-    return TestClient(app)
+    return rt.client()
 
 
-@pytest.fixture(scope="module")
-def complex_client(complex_renderer):
-    """TestClient for a complex form defined locally."""
-    from pydantic import ValidationError
+@pytest.fixture(scope="session")
+def list_client(shared_app):
+    """TestClient for a list form defined locally."""
+    return _form_page_client(
+        shared_app,
+        "test_list",
+        ListTestModel,
+        mui.CardHeader(mui.H2("Test List Form")),
+        submit=True,
+    )
+
 
+@pytest.fixture(scope="session")
+def complex_client(shared_app, complex_renderer):
+    """TestClient for a complex form defined locally."""
     # complex_renderer is already configured with ComplexTestSchema, form_name="test_complex"
     form_renderer = complex_renderer
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
-    )
-    form_renderer.register_routes(app)  # Register list and form action routes
+    rt = _PrefixedRoutes(shared_app, "/test_complex")
+    form_renderer.register_routes(rt)  # Register list and form action routes
 
     @rt("/")
     def get():
@@ -475,87 +829,54 @@ def complex_client(complex_renderer):
             ),
         )
 
-    @rt("/submit_form", methods=["POST"])
-    async def post_main_form(req):
-        try:
-            validated = await form_renderer.model_validate_request(req)
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Successful")),
-                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
-            )
-        except ValidationError as e:
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Error", cls="text-red-500")),
-                mui.CardBody(fh.Pre(e.json(indent=2))),
-            )
+    rt("/submit_form", methods=["POST"])(_make_submit_handler(form_renderer))
 
-    return TestClient(app)
+    return rt.client()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_test_model():
     """A simple model for testing basic fields."""
-
-    class SimpleTestModel(BaseModel):
-        name: str = "Test Model"
-        age: int = 25
-        score: float = 92.5
-
     return SimpleTestModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_test_model():
     """A model with nested fields for testing form parsing."""
-
-    class NestedModel(BaseModel):
-        sub_field: str = "Default Sub"
-        is_active: bool = False
-
-    class TestModel(BaseModel):
-        name: str = "Parent Model"
-        count: Optional[int] = None
-        nested: NestedModel = Field(default_factory=NestedModel)
-
-    return TestModel
+    return NestedParentTestModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def list_test_model():
     """A model with list fields for testing list handling."""
-
-    class ListTestModel(BaseModel):
-        name: str = "List Model"
-        tags: List[str] = Field(default_factory=lambda: ["tag1", "tag2"])
-
     return ListTestModel
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def complex_test_model():
     """Returns the test-specific ComplexTestSchema for reuse in tests."""
     return ComplexTestSchema
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def address_model():
     """Returns the test-specific AddressTestModel for reuse in tests."""
     return AddressTestModel
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def address_model_with_tags():
     """Returns the AddressWithTagsTestModel for nested list testing."""
     return AddressWithTagsTestModel
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def complex_nested_test_model():
     """Returns the ComplexNestedTestSchema for nested list testing."""
     return ComplexNestedTestSchema
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def custom_detail_model():
     """Returns the test-specific CustomDetailTestModel for reuse in tests."""
     return CustomDetailTestModel
@@ -573,62 +894,17 @@ def list_renderer():
     return PydanticForm(form_name="test_list", model_class=ListTestModel)
 
 
-@pytest.fixture(scope="module")
-def complex_renderer(complex_test_model, address_model, custom_detail_model):
-    """A PydanticForm instance for the complex model."""
-    initial_values = complex_test_model(
-        name="Test User",
-        age=30,
-        score=95.0,
-        is_active=True,
-        description="Test description",
-        creation_date=datetime.date(2023, 1, 1),
-        start_time=datetime.time(12, 0, 0),
-        status="PENDING",
-        optional_status=None,
-        tags=["test1", "test2"],
-        main_address=address_model(
-            street="123 Test St", city="Testville", is_billing=True
-        ),
-        custom_detail=custom_detail_model(value="Test Detail", confidence="HIGH"),
-        other_addresses=[
-            address_model(street="456 Other St", city="Otherville", is_billing=False),
-        ],
-        more_custom_details=[
-            custom_detail_model(value="Test Detail 1", confidence="MEDIUM"),
-        ],
-    )
-    return PydanticForm(
-        form_name="test_complex",
-        model_class=complex_test_model,
-        initial_values=initial_values,
-    )
+@pytest.fixture(scope="session")
+def complex_initial_values():
+    """Return initial values for complex form tests (reusable fixture)."""
+    return _COMPLEX_INITIAL
 
 
-@pytest.fixture(scope="module")
-def complex_initial_values(complex_test_model, address_model, custom_detail_model):
-    """Return initial values for complex form tests (reusable fixture)."""
-    return complex_test_model(
-        name="Test User",
-        age=30,
-        score=95.0,
-        is_active=True,
-        description="Test description",
-        creation_date=datetime.date(2023, 1, 1),
-        start_time=datetime.time(12, 0, 0),
-        status="PENDING",
-        optional_status=None,
-        tags=["test1", "test2"],
-        main_address=address_model(
-            street="123 Test St", city="Testville", is_billing=True
-        ),
-        custom_detail=custom_detail_model(value="Test Detail", confidence="HIGH"),
-        other_addresses=[
-            address_model(street="456 Other St", city="Otherville", is_billing=False),
-        ],
-        more_custom_details=[
-            custom_detail_model(value="Test Detail 1", confidence="MEDIUM"),
-        ],
+@pytest.fixture(scope="session")
+def complex_renderer(complex_initial_values):
+    """A PydanticForm instance for the complex model."""
+    return _get_form(
+        "test_complex", ComplexTestSchema, initial_values=complex_initial_values
     )
 
 
@@ -651,104 +927,59 @@ def shipping_method_enum():
     return ShippingMethod
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def enum_test_model():
     """Returns the EnumTestModel class."""
     return EnumTestModel
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def complex_enum_test_model():
     """Returns the ComplexEnumTestModel class."""
     return ComplexEnumTestModel
 
 
-@pytest.fixture(scope="module")
-def enum_form_renderer(enum_test_model):
+@pytest.fixture(scope="session")
+def enum_form_renderer():
     """PydanticForm renderer for simple enum model."""
-    return PydanticForm("enum_test", enum_test_model)
+    return _get_form("enum_test", EnumTestModel)
 
 
-@pytest.fixture(scope="module")
-def complex_enum_form_renderer(complex_enum_test_model):
+@pytest.fixture(scope="session")
+def complex_enum_initial_values():
+    """Initial values for the complex enum form."""
+    return _COMPLEX_ENUM_INITIAL
+
+
+@pytest.fixture(scope="session")
+def complex_enum_form_renderer(complex_enum_initial_values):
     """PydanticForm renderer for complex enum model."""
-    initial_values = complex_enum_test_model(
-        status=OrderStatus.PROCESSING,
-        shipping_method=ShippingMethod.EXPRESS,
-        priority=Priority.HIGH,
-        name="Test Complex Order",
-        order_id=12345,
-        status_history=[OrderStatus.NEW, OrderStatus.PROCESSING],
-        available_priorities=[Priority.LOW, Priority.MEDIUM],
-    )
-    return PydanticForm(
+    return _get_form(
         "complex_enum_test",
-        complex_enum_test_model,
-        initial_values=initial_values,
+        ComplexEnumTestModel,
+        initial_values=complex_enum_initial_values,
     )
 
 
-@pytest.fixture(scope="module")
-def enum_client(enum_form_renderer):
+@pytest.fixture(scope="session")
+def enum_client(shared_app):
     """TestClient for enum form testing."""
-    from pydantic import ValidationError
-
-    form_renderer = enum_form_renderer
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "enum_test",
+        EnumTestModel,
+        mui.CardHeader("Enum Test Form"),
+        submit=True,
     )
-    form_renderer.register_routes(app)
-
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Enum Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            mui.Button(
-                                "Submit", type="submit", cls=mui.ButtonT.primary
-                            ),
-                            hx_post="/submit_form",
-                            hx_target="#result",
-                            hx_swap="innerHTML",
-                            id="enum-test-form",
-                        )
-                    ),
-                ),
-                fh.Div(id="result"),
-            ),
-        )
 
-    @rt("/submit_form", methods=["POST"])
-    async def post_main_form(req):
-        try:
-            validated = await form_renderer.model_validate_request(req)
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Successful")),
-                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
-            )
-        except ValidationError as e:
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Error", cls="text-red-500")),
-                mui.CardBody(fh.Pre(e.json(indent=2))),
-            )
 
-    return TestClient(app)
-
-
-@pytest.fixture(scope="module")
-def complex_enum_client(complex_enum_form_renderer):
+@pytest.fixture(scope="session")
+def complex_enum_client(shared_app, complex_enum_form_renderer):
     """TestClient for complex enum form testing."""
-    from pydantic import ValidationError
 
     form_renderer = complex_enum_form_renderer
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
-    )
-    form_renderer.register_routes(app)
+    rt = _PrefixedRoutes(shared_app, "/complex_enum_test")
+    form_renderer.register_routes(rt)
 
     @rt("/")
     def get():
@@ -776,72 +1007,29 @@ def complex_enum_client(complex_enum_form_renderer):
             ),
         )
 
-    @rt("/submit_form", methods=["POST"])
-    async def post_main_form(req):
-        try:
-            validated = await form_renderer.model_validate_request(req)
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Successful")),
-                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
-            )
-        except ValidationError as e:
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Error", cls="text-red-500")),
-                mui.CardBody(fh.Pre(e.json(indent=2))),
-            )
+    rt("/submit_form", methods=["POST"])(_make_submit_handler(form_renderer))
 
-    return TestClient(app)
+    return rt.client()
 
 
-@pytest.fixture(scope="module")
-def complex_nested_client(
-    complex_nested_test_model, address_model_with_tags, custom_detail_model
-):
+@pytest.fixture(scope="session")
+def complex_nested_initial_values():
+    """Initial values with nested lists for the complex nested form."""
+    return _COMPLEX_NESTED_INITIAL
+
+
+@pytest.fixture(scope="session")
+def complex_nested_client(shared_app, complex_nested_initial_values):
     """TestClient for nested list testing."""
-    from pydantic import ValidationError
-
-    # Create initial values with nested lists
-    initial_values = complex_nested_test_model(
-        name="Nested Test User",
-        age=35,
-        score=92.0,
-        is_active=True,
-        description="Testing nested lists",
-        creation_date=datetime.date(2023, 1, 1),
-        start_time=datetime.time(12, 0, 0),
-        status="PENDING",
-        optional_status=None,
-        tags=["customer", "test"],
-        main_address=address_model_with_tags(
-            street="123 Main St",
-            city="Test City",
-            is_billing=True,
-            tags=["home", "primary"],
-        ),
-        custom_detail=custom_detail_model(value="Nested Detail", confidence="HIGH"),
-        other_addresses=[
-            address_model_with_tags(
-                street="456 Other St",
-                city="Other City",
-                is_billing=False,
-                tags=["work", "backup"],
-            ),
-        ],
-        more_custom_details=[
-            custom_detail_model(value="More Nested Detail", confidence="MEDIUM"),
-        ],
-    )
 
-    form_renderer = PydanticForm(
-        form_name="test_complex_nested",
-        model_class=complex_nested_test_model,
-        initial_values=initial_values,
+    form_renderer = _get_form(
+        "test_complex_nested",
+        ComplexNestedTestSchema,
+        initial_values=complex_nested_initial_values,
     )
 
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
-    )
-    form_renderer.register_routes(app)
+    rt = _PrefixedRoutes(shared_app, "/test_complex_nested")
+    form_renderer.register_routes(rt)
 
     @rt("/")
     def get():
@@ -869,109 +1057,57 @@ def complex_nested_client(
             ),
         )
 
-    @rt("/submit_form", methods=["POST"])
-    async def post_main_form(req):
-        try:
-            validated = await form_renderer.model_validate_request(req)
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Successful")),
-                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
-            )
-        except ValidationError as e:
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Error", cls="text-red-500")),
-                mui.CardBody(fh.Pre(e.json(indent=2))),
-            )
+    rt("/submit_form", methods=["POST"])(_make_submit_handler(form_renderer))
 
-    return TestClient(app)
+    return rt.client()
 
 
-@pytest.fixture(scope="module")
-def globally_disabled_complex_client(complex_test_model, complex_initial_values):
+@pytest.fixture(scope="session")
+def globally_disabled_complex_client(shared_app, complex_initial_values):
     """TestClient for a complex form with all fields disabled."""
-
-    form_renderer = PydanticForm(
-        form_name="test_complex_globally_disabled",
-        model_class=complex_test_model,
+    return _form_page_client(
+        shared_app,
+        "test_complex_globally_disabled",
+        ComplexTestSchema,
+        mui.H1("Complex Test Form (Globally Disabled)"),
         initial_values=complex_initial_values,
         disabled=True,
     )
 
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
-    )
-    form_renderer.register_routes(app)
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.H1("Complex Test Form (Globally Disabled)"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            id="test-complex-globally-disabled-form",
-                        )
-                    ),
-                ),
-            ),
-        )
-
-    return TestClient(app)
-
-
-@pytest.fixture(scope="module")
-def partially_disabled_complex_client(complex_test_model, complex_initial_values):
+@pytest.fixture(scope="session")
+def partially_disabled_complex_client(shared_app, complex_initial_values):
     """TestClient for a complex form with specific fields disabled."""
-
-    form_renderer = PydanticForm(
-        form_name="test_complex_partially_disabled",
-        model_class=complex_test_model,
+    return _form_page_client(
+        shared_app,
+        "test_complex_partially_disabled",
+        ComplexTestSchema,
+        mui.H1("Complex Test Form (Partially Disabled)"),
         initial_values=complex_initial_values,
         disabled_fields=["name", "main_address", "tags"],
     )
 
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
-    )
-    form_renderer.register_routes(app)
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.H1("Complex Test Form (Partially Disabled)"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            id="test-complex-partially-disabled-form",
-                        )
-                    ),
-                ),
-            ),
-        )
-
-    return TestClient(app)
-
-
-@pytest.fixture
-def htmx_headers():
-    """Standard HTMX request headers for testing."""
-    return {
+# Standard HTMX request headers, read-only so one instance can serve every test
+_HTMX_HEADERS = MappingProxyType(
+    {
         "HX-Request": "true",
         "HX-Current-URL": "http://testserver/",
         "HX-Target": "result",
         "Content-Type": "application/x-www-form-urlencoded",
     }
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def htmx_headers():
+    """Standard HTMX request headers for testing."""
+    return _HTMX_HEADERS
+
+
+@pytest.fixture(scope="session")
 def sample_field_info():
     """Create a sample FieldInfo for testing."""
-    from pydantic.fields import FieldInfo
-
     return FieldInfo(annotation=str)
 
 
@@ -983,314 +1119,127 @@ def freeze_today(mocker):
     )
 
 
-@pytest.fixture(scope="module")
-def simple_list_client():
+@pytest.fixture(scope="session")
+def simple_list_client(shared_app):
     """TestClient for testing simple list operations."""
-
-    class SimpleListModel(BaseModel):
-        name: str = "Test Model"
-        tags: List[str] = Field(default_factory=list)
-
-    form_renderer = PydanticForm("test_simple_list", SimpleListModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "test_simple_list",
+        SimpleListModel,
+        mui.CardHeader("Simple List Test Form"),
     )
-    form_renderer.register_routes(app)
-
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Simple List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(), id="test-simple-list-form"
-                        )
-                    ),
-                ),
-            ),
-        )
-
-    return TestClient(app)
 
 
-@pytest.fixture(scope="module")
-def address_list_client():
+@pytest.fixture(scope="session")
+def address_list_client(shared_app):
     """TestClient for testing address list operations with model items."""
-
-    class AddressModel(BaseModel):
-        street: str
-        city: str
-        is_billing: bool = False
-
-        def __str__(self) -> str:
-            return f"{self.street}, {self.city} ({'billing' if self.is_billing else 'shipping'})"
-
-    class AddressListModel(BaseModel):
-        name: str = "Address List"
-        addresses: List[AddressModel] = Field(default_factory=list)
-
-    form_renderer = PydanticForm("test_address_list", AddressListModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "test_address_list",
+        AddressListModel,
+        mui.CardHeader("Address List Test Form"),
     )
-    form_renderer.register_routes(app)
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Address List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(), id="test-address-list-form"
-                        )
-                    ),
-                ),
-            ),
-        )
-
-    return TestClient(app)
 
-
-@pytest.fixture(scope="module")
-def custom_model_list_client():
+@pytest.fixture(scope="session")
+def custom_model_list_client(shared_app):
     """TestClient for testing list operations with models that have explicit defaults."""
-
-    class CustomItemModel(BaseModel):
-        name: str = "Default Item"
-        value: str = "Default Value"
-        priority: int = 1
-        is_active: bool = True
-
-        def __str__(self) -> str:
-            return f"{self.name}: {self.value}"
-
-    class CustomListModel(BaseModel):
-        title: str = "Custom List"
-        items: List[CustomItemModel] = Field(default_factory=list)
-
-    form_renderer = PydanticForm("test_custom_list", CustomListModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "test_custom_list",
+        CustomListModel,
+        mui.CardHeader("Custom List Test Form"),
     )
-    form_renderer.register_routes(app)
-
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Custom List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(), id="test-custom-list-form"
-                        )
-                    ),
-                ),
-            ),
-        )
 
-    return TestClient(app)
 
-
-@pytest.fixture(scope="module")
-def optional_model_list_client():
+@pytest.fixture(scope="session")
+def optional_model_list_client(shared_app):
     """TestClient for testing list operations with optional fields."""
-
-    class OptionalItemModel(BaseModel):
-        name: str  # Required field
-        description: Optional[str]  # Optional field without default
-        nickname: Optional[str] = "Default Nick"  # Optional field with default
-        score: Optional[int]  # Optional field without default
-
-        def __str__(self) -> str:
-            return f"{self.name} ({self.nickname or 'no nickname'})"
-
-    class OptionalListModel(BaseModel):
-        title: str = "Optional List"
-        items: List[OptionalItemModel] = Field(default_factory=list)
-
-    form_renderer = PydanticForm("test_optional_list", OptionalListModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "test_optional_list",
+        OptionalListModel,
+        mui.CardHeader("Optional List Test Form"),
     )
-    form_renderer.register_routes(app)
-
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Optional List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(), id="test-optional-list-form"
-                        )
-                    ),
-                ),
-            ),
-        )
-
-    return TestClient(app)
 
 
-@pytest.fixture(scope="module")
-def literal_model_list_client():
+@pytest.fixture(scope="session")
+def literal_model_list_client(shared_app):
     """TestClient for testing list operations with Literal fields."""
-
-    class LiteralItemModel(BaseModel):
-        name: str
-        status: Literal["PENDING", "ACTIVE", "COMPLETED"]
-        priority: Optional[Literal["HIGH", "MEDIUM", "LOW"]]
-
-        def __str__(self) -> str:
-            return f"{self.name} ({self.status})"
-
-    class LiteralListModel(BaseModel):
-        title: str = "Literal List"
-        items: List[LiteralItemModel] = Field(default_factory=list)
-
-    form_renderer = PydanticForm("test_literal_list", LiteralListModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "test_literal_list",
+        LiteralListModel,
+        mui.CardHeader("Literal List Test Form"),
     )
-    form_renderer.register_routes(app)
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Literal List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(), id="test-literal-list-form"
-                        )
-                    ),
-                ),
-            ),
-        )
-
-    return TestClient(app)
 
-
-@pytest.fixture(scope="module")
-def nested_model_list_client():
+@pytest.fixture(scope="session")
+def nested_model_list_client(shared_app):
     """TestClient for testing list operations with nested models."""
-
-    class InnerModel(BaseModel):
-        inner_name: str
-        inner_value: int = 10
-
-        def __str__(self) -> str:
-            return f"Inner: {self.inner_name}"
-
-    class NestedItemModel(BaseModel):
-        name: str
-        inner: InnerModel
-
-        def __str__(self) -> str:
-            return f"{self.name} -> {self.inner}"
-
-    class NestedListModel(BaseModel):
-        title: str = "Nested List"
-        items: List[NestedItemModel] = Field(default_factory=list)
-
-    form_renderer = PydanticForm("test_nested_list", NestedListModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "test_nested_list",
+        NestedListModel,
+        mui.CardHeader("Nested List Test Form"),
     )
-    form_renderer.register_routes(app)
-
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Nested List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(), id="test-nested-list-form"
-                        )
-                    ),
-                ),
-            ),
-        )
-
-    return TestClient(app)
 
 
-@pytest.fixture(scope="module")
-def datetime_model_list_client():
+@pytest.fixture(scope="session")
+def datetime_model_list_client(shared_app):
     """TestClient for testing list operations with date/time fields."""
-
-    class DateTimeItemModel(BaseModel):
-        name: str
-        created_date: datetime.date
-        start_time: datetime.time
-        optional_date: Optional[datetime.date]
-
-        def __str__(self) -> str:
-            return f"{self.name} ({self.created_date})"
-
-    class DateTimeListModel(BaseModel):
-        title: str = "DateTime List"
-        items: List[DateTimeItemModel] = Field(default_factory=list)
-
-    form_renderer = PydanticForm("test_datetime_list", DateTimeListModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "test_datetime_list",
+        DateTimeListModel,
+        mui.CardHeader("DateTime List Test Form"),
     )
-    form_renderer.register_routes(app)
 
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("DateTime List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(), id="test-datetime-list-form"
-                        )
-                    ),
-                ),
-            ),
-        )
 
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def user_default_list_client(shared_app):
+    """TestClient for testing list operations with user-defined default methods."""
+    return _form_page_client(
+        shared_app,
+        "test_user_default_list",
+        UserDefaultListModel,
+        mui.CardHeader("User Default List Test Form"),
+    )
 
 
-@pytest.fixture(autouse=True)
-def _stub_fasthtml_serve(monkeypatch):
+@pytest.fixture(autouse=True, scope="session")
+def _stub_fasthtml_serve():
     """
     Prevent `fh.serve()` from starting a real event-loop when any example
     is imported.  It only affects the *examples* because core library code
-    never calls `fh.serve()` at import time.
+    never calls `fh.serve()` at import time, so one patch for the whole
+    session is enough.
     """
-    monkeypatch.setattr("fasthtml.common.serve", lambda *a, **kw: None, raising=False)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("fasthtml.common.serve", lambda *a, **kw: None, raising=False)
+        yield
 
 
 # --- HTML parsing helper fixtures ---
-@pytest.fixture
+@pytest.fixture(scope="session")
 def soup():
     """Return a callable that converts HTML text to BeautifulSoup object."""
 
     def _make(html: str):
-        import bs4
-
         return bs4.BeautifulSoup(html, "html.parser")
 
     return _make
 
 
+def _frozen_time() -> float:
+    return 1_700_000_000
+
+
 @pytest.fixture
-def patch_time(mocker):
+def patch_time(monkeypatch):
     """Freeze time.time() so placeholder IDs are stable inside tests."""
-    return mocker.patch("time.time", return_value=1_700_000_000)
+    monkeypatch.setattr("time.time", _frozen_time)
+    return _frozen_time
 
 
 @pytest.fixture
@@ -1313,8 +1262,6 @@ def add_item(htmx_headers, soup):
 def skip_json_schema_model():
     """Model with various SkipJsonSchema fields for testing."""
 
-    from typing import Any, Dict
-
     class TestSkipModel(BaseModel):
         # Regular fields
         name: str
@@ -1330,26 +1277,25 @@ def skip_json_schema_model():
     return TestSkipModel
 
 
-@pytest.fixture
-def document_like_model():
-    """Model simulating Document base class pattern."""
+class DocumentBase(BaseModel):
+    id: SkipJsonSchema[Optional[str]] = Field(default_factory=lambda: str(uuid4()))
+    created_at: SkipJsonSchema[datetime.datetime] = Field(
+        default_factory=datetime.datetime.now
+    )
+    updated_at: SkipJsonSchema[datetime.datetime] = Field(
+        default_factory=datetime.datetime.now
+    )
 
-    from uuid import uuid4
 
-    class DocumentBase(BaseModel):
-        id: SkipJsonSchema[Optional[str]] = Field(default_factory=lambda: str(uuid4()))
-        created_at: SkipJsonSchema[datetime.datetime] = Field(
-            default_factory=datetime.datetime.now
-        )
-        updated_at: SkipJsonSchema[datetime.datetime] = Field(
-            default_factory=datetime.datetime.now
-        )
+class UserDocument(DocumentBase):
+    name: str
+    email: str
+    age: Optional[int] = None
 
-    class UserDocument(DocumentBase):
-        name: str
-        email: str
-        age: Optional[int] = None
 
+@pytest.fixture(scope="session")
+def document_like_model():
+    """Model simulating Document base class pattern."""
     return UserDocument
 
 
@@ -1366,34 +1312,30 @@ def mock_skip_defaults(mocker):
 
 
 # Decimal-related fixtures
-@pytest.fixture(scope="module")
-def decimal_test_model():
-    """Simple decimal test model for reuse across tests."""
-    from decimal import Decimal
-    from typing import Optional
+class DecimalTestModel(BaseModel):
+    price: Decimal
+    cost: Optional[Decimal] = None
+    margin: Decimal = Decimal("0.30")
+
+
+class ComplexDecimalModel(BaseModel):
+    name: str = "Test Product"
+    base_price: Decimal
+    discount: Optional[Decimal] = None
+    tax_rate: Decimal = Decimal("0.08")
+    fees: List[Decimal] = Field(default_factory=list)
+    total: Optional[Decimal] = Field(default=None)
 
-    class DecimalTestModel(BaseModel):
-        price: Decimal
-        cost: Optional[Decimal] = None
-        margin: Decimal = Decimal("0.30")
 
+@pytest.fixture(scope="session")
+def decimal_test_model():
+    """Simple decimal test model for reuse across tests."""
     return DecimalTestModel
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def complex_decimal_test_model():
     """Complex decimal test model with various field types."""
-    from decimal import Decimal
-    from typing import List, Optional
-
-    class ComplexDecimalModel(BaseModel):
-        name: str = "Test Product"
-        base_price: Decimal
-        discount: Optional[Decimal] = None
-        tax_rate: Decimal = Decimal("0.08")
-        fees: List[Decimal] = Field(default_factory=list)
-        total: Optional[Decimal] = Field(default=None)
-
     return ComplexDecimalModel
 
 
@@ -1432,99 +1374,21 @@ def complex_decimal_form_data():
     }
 
 
-@pytest.fixture(scope="module")
-def decimal_client(decimal_test_model):
+@pytest.fixture(scope="session")
+def decimal_client(shared_app, decimal_test_model):
     """TestClient for decimal form E2E testing."""
-    form_renderer = PydanticForm("decimal_client_form", decimal_test_model)
-    app, rt = fh.fast_app(hdrs=[mui.Theme.blue.headers()], pico=False, live=False)
-
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Decimal Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            mui.Button(
-                                "Submit", type="submit", cls=mui.ButtonT.primary
-                            ),
-                            hx_post="/submit_form",
-                            hx_target="#result",
-                            hx_swap="innerHTML",
-                            id="decimal-test-form",
-                        )
-                    ),
-                ),
-                fh.Div(id="result"),
-            ),
-        )
-
-    @rt("/submit_form", methods=["POST"])
-    async def post_submit_form(req):
-        try:
-            validated = await form_renderer.model_validate_request(req)
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Successful")),
-                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
-            )
-        except ValidationError as e:
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Error", cls="text-red-500")),
-                mui.CardBody(fh.Pre(e.json(indent=2))),
-            )
-
-    return TestClient(app)
-
-
-@pytest.fixture(scope="module")
-def user_default_list_client():
-    """TestClient for testing list operations with user-defined default methods."""
-
-    class UserDefaultItemModel(BaseModel):
-        name: str
-        value: str
-        count: int
-
-        @classmethod
-        def default(cls):
-            return cls(name="User Default Name", value="User Default Value", count=42)
-
-        def __str__(self) -> str:
-            return f"{self.name}: {self.value} (x{self.count})"
-
-    class UserDefaultListModel(BaseModel):
-        title: str = "User Default List"
-        items: List[UserDefaultItemModel] = Field(default_factory=list)
-
-    form_renderer = PydanticForm("test_user_default_list", UserDefaultListModel)
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "decimal_client_form",
+        decimal_test_model,
+        mui.CardHeader("Decimal Test Form"),
+        submit=True,
+        form_id="decimal-test-form",
     )
-    form_renderer.register_routes(app)
-
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("User Default List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            id="test-user-default-list-form",
-                        )
-                    ),
-                ),
-            ),
-        )
-
-    return TestClient(app)
 
 
 # Optional List Testing Fixtures
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def optional_list_test_model():
     """Test model for Optional[List[...]] functionality."""
 
@@ -1539,18 +1403,17 @@ def optional_list_test_model():
     return OptionalListTestModel
 
 
-@pytest.fixture(scope="module")
-def optional_list_client(optional_list_test_model):
+@pytest.fixture(scope="session")
+def optional_list_client(shared_app, optional_list_test_model):
     """TestClient for testing optional list functionality."""
-    form_renderer = PydanticForm(
+
+    form_renderer = _get_form(
         "optional_list_form",
         optional_list_test_model,
         initial_values={"name": "Test Name"},  # optional_tags will be None
     )
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
-    )
-    form_renderer.register_routes(app)
+    rt = _PrefixedRoutes(shared_app, "/optional_list_form")
+    form_renderer.register_routes(rt)
 
     @rt("/")
     def get():
@@ -1590,11 +1453,11 @@ def optional_list_client(optional_list_test_model):
                 temp_renderer.render_inputs(),
             )
 
-    return TestClient(app)
+    return rt.client()
 
 
 # Nested List Testing Fixtures
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def nested_list_test_models():
     """Models for testing nested list scenarios."""
 
@@ -1605,7 +1468,7 @@ def nested_list_test_models():
         is_primary: bool = False
 
         def __str__(self) -> str:
-            tag_str = ", ".join(self.tags) if self.tags else "no tags"
+            tag_str = ", ".join(self.tags) or "no tags"
             return f"{self.street}, {self.city} ({tag_str})"
 
     class ContactInfo(BaseModel):
@@ -1643,184 +1506,164 @@ def nested_list_test_models():
     }
 
 
+_SIMPLE_NESTED_FORM_DATA = {
+    "test_nested_company_name": "Acme Corp",
+    "test_nested_company_industry": "Software",
+    "test_nested_company_tags_0": "startup",
+    "test_nested_company_tags_1": "tech",
+    "test_nested_company_locations_0_street": "123 Main St",
+    "test_nested_company_locations_0_city": "Boston",
+    "test_nested_company_locations_0_tags_0": "headquarters",
+    "test_nested_company_locations_0_tags_1": "main-office",
+    "test_nested_company_locations_0_is_primary": "on",
+}
+
+
 @pytest.fixture
 def simple_nested_form_data():
     """Simple nested list form data for basic testing."""
-    return {
-        "test_nested_company_name": "Acme Corp",
-        "test_nested_company_industry": "Software",
-        "test_nested_company_tags_0": "startup",
-        "test_nested_company_tags_1": "tech",
-        "test_nested_company_locations_0_street": "123 Main St",
-        "test_nested_company_locations_0_city": "Boston",
-        "test_nested_company_locations_0_tags_0": "headquarters",
-        "test_nested_company_locations_0_tags_1": "main-office",
-        "test_nested_company_locations_0_is_primary": "on",
-    }
+    return _SIMPLE_NESTED_FORM_DATA.copy()
+
+
+_COMPLEX_NESTED_FORM_DATA = {
+    "test_nested_company_name": "Acme Corp",
+    "test_nested_company_industry": "Software",
+    "test_nested_company_tags_0": "startup",
+    "test_nested_company_tags_1": "tech",
+    # First location with tags
+    "test_nested_company_locations_0_street": "123 Main St",
+    "test_nested_company_locations_0_city": "Boston",
+    "test_nested_company_locations_0_tags_0": "headquarters",
+    "test_nested_company_locations_0_tags_1": "main-office",
+    "test_nested_company_locations_0_is_primary": "on",
+    # Second location with different tags
+    "test_nested_company_locations_1_street": "456 Oak Ave",
+    "test_nested_company_locations_1_city": "Cambridge",
+    "test_nested_company_locations_1_tags_0": "satellite",
+    "test_nested_company_locations_1_tags_new_12345": "new-tag",
+    # Contact with notes
+    "test_nested_company_contacts_0_phone": "555-1234",
+    "test_nested_company_contacts_0_email": "contact@acme.com",
+    "test_nested_company_contacts_0_notes_0": "Primary contact",
+    "test_nested_company_contacts_0_notes_1": "Available 9-5",
+}
 
 
 @pytest.fixture
 def complex_nested_form_data():
     """Complex nested list form data with multiple levels."""
-    return {
-        "test_nested_company_name": "Acme Corp",
-        "test_nested_company_industry": "Software",
-        "test_nested_company_tags_0": "startup",
-        "test_nested_company_tags_1": "tech",
-        # First location with tags
-        "test_nested_company_locations_0_street": "123 Main St",
-        "test_nested_company_locations_0_city": "Boston",
-        "test_nested_company_locations_0_tags_0": "headquarters",
-        "test_nested_company_locations_0_tags_1": "main-office",
-        "test_nested_company_locations_0_is_primary": "on",
-        # Second location with different tags
-        "test_nested_company_locations_1_street": "456 Oak Ave",
-        "test_nested_company_locations_1_city": "Cambridge",
-        "test_nested_company_locations_1_tags_0": "satellite",
-        "test_nested_company_locations_1_tags_new_12345": "new-tag",
-        # Contact with notes
-        "test_nested_company_contacts_0_phone": "555-1234",
-        "test_nested_company_contacts_0_email": "contact@acme.com",
-        "test_nested_company_contacts_0_notes_0": "Primary contact",
-        "test_nested_company_contacts_0_notes_1": "Available 9-5",
-    }
+    return _COMPLEX_NESTED_FORM_DATA.copy()
+
+
+_DEEPLY_NESTED_FORM_DATA = {
+    "test_project_title": "Mega Project",
+    "test_project_description": "Large scale project",
+    "test_project_milestones_0": "Phase 1",
+    "test_project_milestones_1": "Phase 2",
+    # Company 1 with nested data
+    "test_project_companies_0_name": "Company A",
+    "test_project_companies_0_industry": "Tech",
+    "test_project_companies_0_tags_0": "partner",
+    "test_project_companies_0_locations_0_street": "100 Tech St",
+    "test_project_companies_0_locations_0_city": "Tech City",
+    "test_project_companies_0_locations_0_tags_0": "main",
+    "test_project_companies_0_contacts_0_phone": "555-0001",
+    "test_project_companies_0_contacts_0_email": "a@company.com",
+    "test_project_companies_0_contacts_0_notes_0": "Lead contact",
+    # Company 2 with nested data
+    "test_project_companies_1_name": "Company B",
+    "test_project_companies_1_industry": "Finance",
+    "test_project_companies_1_tags_0": "client",
+    "test_project_companies_1_locations_0_street": "200 Money St",
+    "test_project_companies_1_locations_0_city": "Finance City",
+    "test_project_companies_1_locations_0_tags_0": "branch",
+    "test_project_companies_1_contacts_0_phone": "555-0002",
+    "test_project_companies_1_contacts_0_email": "b@company.com",
+    "test_project_companies_1_contacts_0_notes_0": "Account manager",
+}
 
 
 @pytest.fixture
 def deeply_nested_form_data():
     """Deeply nested structure for stress testing."""
-    return {
-        "test_project_title": "Mega Project",
-        "test_project_description": "Large scale project",
-        "test_project_milestones_0": "Phase 1",
-        "test_project_milestones_1": "Phase 2",
-        # Company 1 with nested data
-        "test_project_companies_0_name": "Company A",
-        "test_project_companies_0_industry": "Tech",
-        "test_project_companies_0_tags_0": "partner",
-        "test_project_companies_0_locations_0_street": "100 Tech St",
-        "test_project_companies_0_locations_0_city": "Tech City",
-        "test_project_companies_0_locations_0_tags_0": "main",
-        "test_project_companies_0_contacts_0_phone": "555-0001",
-        "test_project_companies_0_contacts_0_email": "a@company.com",
-        "test_project_companies_0_contacts_0_notes_0": "Lead contact",
-        # Company 2 with nested data
-        "test_project_companies_1_name": "Company B",
-        "test_project_companies_1_industry": "Finance",
-        "test_project_companies_1_tags_0": "client",
-        "test_project_companies_1_locations_0_street": "200 Money St",
-        "test_project_companies_1_locations_0_city": "Finance City",
-        "test_project_companies_1_locations_0_tags_0": "branch",
-        "test_project_companies_1_contacts_0_phone": "555-0002",
-        "test_project_companies_1_contacts_0_email": "b@company.com",
-        "test_project_companies_1_contacts_0_notes_0": "Account manager",
-    }
+    return _DEEPLY_NESTED_FORM_DATA.copy()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_list_parser_simple(nested_list_test_models):
     """Form parser configured for simple nested list testing."""
-    return PydanticForm("test_nested_company", nested_list_test_models["Company"])
+    return _get_form("test_nested_company", nested_list_test_models["Company"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_list_parser_complex(nested_list_test_models):
     """Form parser configured for complex nested list testing."""
-    return PydanticForm("test_project", nested_list_test_models["NestedProject"])
+    return _get_form("test_project", nested_list_test_models["NestedProject"])
+
+
+_MALFORMED_NESTED_FORM_DATA = {
+    "test_nested_company_name": "Bad Corp",
+    # Missing indices and malformed field names
+    "test_nested_company_locations_street": "No index",
+    "test_nested_company_locations_0_invalid_field": "Bad field",
+    "test_nested_company_locations_abc_city": "Non-numeric index",
+    "test_nested_company_tags_": "Empty index",
+    "test_nested_company_contacts_0_notes_x_content": "Invalid nested index",
+}
 
 
 @pytest.fixture
 def malformed_nested_form_data():
     """Malformed nested data for error handling tests."""
-    return {
-        "test_nested_company_name": "Bad Corp",
-        # Missing indices and malformed field names
-        "test_nested_company_locations_street": "No index",
-        "test_nested_company_locations_0_invalid_field": "Bad field",
-        "test_nested_company_locations_abc_city": "Non-numeric index",
-        "test_nested_company_tags_": "Empty index",
-        "test_nested_company_contacts_0_notes_x_content": "Invalid nested index",
-    }
+    return _MALFORMED_NESTED_FORM_DATA.copy()
+
+
+_EMPTY_NESTED_LISTS_DATA = {
+    "test_nested_company_name": "Empty Corp",
+    "test_nested_company_industry": "None",
+    # No list items - testing empty list handling
+}
 
 
 @pytest.fixture
 def empty_nested_lists_data():
     """Data with empty nested lists for edge case testing."""
-    return {
-        "test_nested_company_name": "Empty Corp",
-        "test_nested_company_industry": "None",
-        # No list items - testing empty list handling
-    }
+    return _EMPTY_NESTED_LISTS_DATA.copy()
+
+
+_MIXED_VALID_INVALID_NESTED_DATA = {
+    "test_nested_company_name": "Mixed Corp",
+    # Valid location
+    "test_nested_company_locations_0_street": "Valid St",
+    "test_nested_company_locations_0_city": "Valid City",
+    "test_nested_company_locations_0_tags_0": "valid-tag",
+    # Invalid location data
+    "test_nested_company_locations_1_street": "",  # Empty required field
+    "test_nested_company_locations_1_tags_0": "valid-tag-in-invalid-item",
+    # Valid contact
+    "test_nested_company_contacts_0_phone": "555-1234",
+    "test_nested_company_contacts_0_email": "valid@email.com",
+    "test_nested_company_contacts_0_notes_0": "Valid note",
+    # Invalid contact
+    "test_nested_company_contacts_1_phone": "",  # Empty required field
+    "test_nested_company_contacts_1_email": "invalid-email",  # Invalid format
+    "test_nested_company_contacts_1_notes_0": "Note for invalid contact",
+}
 
 
 @pytest.fixture
 def mixed_valid_invalid_nested_data():
     """Mix of valid and invalid nested data."""
-    return {
-        "test_nested_company_name": "Mixed Corp",
-        # Valid location
-        "test_nested_company_locations_0_street": "Valid St",
-        "test_nested_company_locations_0_city": "Valid City",
-        "test_nested_company_locations_0_tags_0": "valid-tag",
-        # Invalid location data
-        "test_nested_company_locations_1_street": "",  # Empty required field
-        "test_nested_company_locations_1_tags_0": "valid-tag-in-invalid-item",
-        # Valid contact
-        "test_nested_company_contacts_0_phone": "555-1234",
-        "test_nested_company_contacts_0_email": "valid@email.com",
-        "test_nested_company_contacts_0_notes_0": "Valid note",
-        # Invalid contact
-        "test_nested_company_contacts_1_phone": "",  # Empty required field
-        "test_nested_company_contacts_1_email": "invalid-email",  # Invalid format
-        "test_nested_company_contacts_1_notes_0": "Note for invalid contact",
-    }
+    return _MIXED_VALID_INVALID_NESTED_DATA.copy()
 
 
-@pytest.fixture(scope="module")
-def nested_list_client(nested_list_test_models):
+@pytest.fixture(scope="session")
+def nested_list_client(shared_app, nested_list_test_models):
     """TestClient for testing nested list operations via HTTP."""
-
-    form_renderer = PydanticForm("test_nested_http", nested_list_test_models["Company"])
-    app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()], pico=False, live=False
+    return _form_page_client(
+        shared_app,
+        "test_nested_http",
+        nested_list_test_models["Company"],
+        mui.CardHeader("Nested List Test Form"),
+        submit=True,
     )
-    form_renderer.register_routes(app)
-
-    @rt("/")
-    def get():
-        return fh.Div(
-            mui.Container(
-                mui.CardHeader("Nested List Test Form"),
-                mui.Card(
-                    mui.CardBody(
-                        mui.Form(
-                            form_renderer.render_inputs(),
-                            mui.Button(
-                                "Submit", type="submit", cls=mui.ButtonT.primary
-                            ),
-                            hx_post="/submit_form",
-                            hx_target="#result",
-                            hx_swap="innerHTML",
-                            id="test-nested-http-form",
-                        )
-                    ),
-                ),
-                fh.Div(id="result"),
-            ),
-        )
-
-    @rt("/submit_form", methods=["POST"])
-    async def post_main_form(req):
-        try:
-            validated = await form_renderer.model_validate_request(req)
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Successful")),
-                mui.CardBody(fh.Pre(validated.model_dump_json(indent=2))),
-            )
-        except ValidationError as e:
-            return mui.Card(
-                mui.CardHeader(fh.H3("Validation Error", cls="text-red-500")),
-                mui.CardBody(fh.Pre(e.json(indent=2))),
-            )
-
-    return TestClient(app)
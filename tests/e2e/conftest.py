@@ -1,12 +1,10 @@
 import json
 import socket
 import threading
-import time
+from contextlib import contextmanager
 from typing import Literal, Optional
 
 import fasthtml.common as fh
-from fastcore.xml import FT
-import httpx
 import monsterui.all as mui
 import pytest
 import uvicorn
@@ -15,6 +13,11 @@ from pydantic import BaseModel, Field, ValidationError
 from fh_pydantic_form import PydanticForm, list_manipulation_js
 from fh_pydantic_form.comparison_form import ComparisonForm, comparison_form_js
 
+# Both apps share these header trees; build them once at import
+_BLUE_HDRS = mui.Theme.blue.headers()
+_LIST_JS = list_manipulation_js()
+_COMPARISON_JS = comparison_form_js()
+
 
 class Note(BaseModel):
     text: str
@@ -40,9 +43,8 @@ class CopyModel(BaseModel):
     labels: list[Literal["Alpha", "Beta", "Gamma"]] = Field(default_factory=list)
 
 
-def _htmx_stub_script() -> FT:
-    return fh.Script(
-        """
+_HTMX_STUB = fh.Script(
+    """
 (() => {
   if (window.htmx) {
     return;
@@ -80,32 +82,33 @@ def _htmx_stub_script() -> FT:
   };
 })();
 """
-    )
+)
 
 
 def _build_app():
-    left_values = CopyModel(
+    # Literal, known-good seed data, so skip validation
+    left_values = CopyModel.model_construct(
         title="Left Title",
         count=3,
         entries=[
-            Entry(
+            Entry.model_construct(
                 title="Entry Zero",
                 count=1,
-                notes=[Note(text="Left Note A", severity="HIGH")],
+                notes=[Note.model_construct(text="Left Note A", severity="HIGH")],
             ),
-            Entry(
+            Entry.model_construct(
                 title="Entry One",
                 count=2,
-                notes=[Note(text="Left Note B", severity="LOW")],
+                notes=[Note.model_construct(text="Left Note B", severity="LOW")],
             ),
         ],
         labels=["Alpha", "Gamma"],
     )
-    right_values = CopyModel(
+    right_values = CopyModel.model_construct(
         title="Right Title",
         count=1,
         entries=[
-            Entry(
+            Entry.model_construct(
                 title="Right Entry",
                 count=0,
                 notes=[],
@@ -126,14 +129,12 @@ def _build_app():
     )
 
     app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js(), comparison_form_js()],
+        hdrs=[_BLUE_HDRS, _LIST_JS, _COMPARISON_JS],
         pico=False,
         live=False,
     )
     comparison.register_routes(app)
 
-    htmx_stub = _htmx_stub_script()
-
     @rt("/")
     def index():
         return mui.Container(
@@ -145,7 +146,7 @@ def _build_app():
                 method="post",
                 id="comparison-form",
             ),
-            htmx_stub,
+            _HTMX_STUB,
         )
 
     @rt("/submit", methods=["POST"])
@@ -203,7 +204,8 @@ class ComplexFormModel(BaseModel):
 
 
 def _build_complex_form_app():
-    initial_values = ComplexFormModel(
+    # Literal, known-good seed data, so skip validation
+    initial_values = ComplexFormModel.model_construct(
         name="Initial User",
         age=30,
         score=88.5,
@@ -214,7 +216,7 @@ def _build_complex_form_app():
         tags=["initial", "seed"],
         categories=["Alpha"],
         addresses=[
-            Address(
+            Address.model_construct(
                 street="123 Main St",
                 city="Austin",
                 is_primary=True,
@@ -222,7 +224,9 @@ def _build_complex_form_app():
             )
         ],
         contacts=[
-            Contact(name="Jane Doe", email="jane@example.com", phones=["555-0101"])
+            Contact.model_construct(
+                name="Jane Doe", email="jane@example.com", phones=["555-0101"]
+            )
         ],
     )
 
@@ -233,14 +237,12 @@ def _build_complex_form_app():
     )
 
     app, rt = fh.fast_app(
-        hdrs=[mui.Theme.blue.headers(), list_manipulation_js()],
+        hdrs=[_BLUE_HDRS, _LIST_JS],
         pico=False,
         live=False,
     )
     form.register_routes(app)
 
-    htmx_stub = _htmx_stub_script()
-
     @rt("/")
     def index():
         return mui.Container(
@@ -257,7 +259,7 @@ def _build_complex_form_app():
                 method="post",
                 id="complex-form",
             ),
-            htmx_stub,
+            _HTMX_STUB,
         )
 
     @rt("/submit", methods=["POST"])
@@ -274,63 +276,98 @@ def _build_complex_form_app():
     return app
 
 
+class _ReadyServer(uvicorn.Server):
+    """uvicorn server that signals once its socket is bound."""
+
+    def __init__(self, config: uvicorn.Config) -> None:
+        super().__init__(config)
+        self.ready = threading.Event()
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets)
+        self.ready.set()
+
+
 def _pick_free_port() -> int:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
         sock.bind(("127.0.0.1", 0))
         return sock.getsockname()[1]
 
 
-@pytest.fixture(scope="session")
-def app_server():
-    app = _build_app()
+@contextmanager
+def _running_server(app, name: str):
+    """Serve ``app`` on a free local port in a background thread."""
     port = _pick_free_port()
-    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
-    server = uvicorn.Server(config)
+    # Plain asyncio loop: skips probing for uvloop, which the suite never needs
+    config = uvicorn.Config(
+        app, host="127.0.0.1", port=port, log_level="warning", loop="asyncio"
+    )
+    server = _ReadyServer(config)
 
     thread = threading.Thread(target=server.run, daemon=True)
     thread.start()
 
-    base_url = f"http://127.0.0.1:{port}"
-    for _ in range(50):
-        try:
-            httpx.get(base_url, timeout=0.5)
-            break
-        except httpx.RequestError:
-            time.sleep(0.1)
-    else:
+    if not server.ready.wait(timeout=10) or not server.started:
         server.should_exit = True
         thread.join(timeout=5)
-        raise RuntimeError("Timed out waiting for the app server to start")
+        raise RuntimeError(f"Timed out waiting for the {name} to start")
 
-    yield base_url
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
 
-    server.should_exit = True
-    thread.join(timeout=5)
+
+@pytest.fixture(scope="session")
+def app_server():
+    with _running_server(_build_app(), "app server") as base_url:
+        yield base_url
 
 
 @pytest.fixture(scope="session")
 def complex_form_server():
-    app = _build_complex_form_app()
-    port = _pick_free_port()
-    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
-    server = uvicorn.Server(config)
+    with _running_server(_build_complex_form_app(), "complex form server") as base_url:
+        yield base_url
 
-    thread = threading.Thread(target=server.run, daemon=True)
-    thread.start()
 
-    base_url = f"http://127.0.0.1:{port}"
-    for _ in range(50):
-        try:
-            httpx.get(base_url, timeout=0.5)
-            break
-        except httpx.RequestError:
-            time.sleep(0.1)
-    else:
-        server.should_exit = True
-        thread.join(timeout=5)
-        raise RuntimeError("Timed out waiting for the complex form server to start")
+def _block_static_assets(context) -> None:
+    # No test checks visuals, so skip images and fonts pulled in by the theme
+    context.route(
+        "**/*.{png,jpg,jpeg,gif,svg,ico,woff,woff2,ttf}", lambda route: route.abort()
+    )
 
-    yield base_url
 
-    server.should_exit = True
-    thread.join(timeout=5)
+@pytest.fixture(scope="session")
+def _shared_context(browser, browser_context_args):
+    """One browser context per session instead of pytest-playwright's per test."""
+    context = browser.new_context(**browser_context_args)
+    _block_static_assets(context)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def context(request, pytestconfig):
+    """Hand out the per-session context unless the test needs its own.
+
+    Tracing, video and screenshots are recorded by pytest-playwright's
+    ``new_context``, as are per-test ``browser_context_args`` markers, so those
+    runs fall back to a fresh context. pytest-playwright's ``page`` fixture
+    opens a new tab in whichever context is returned.
+    """
+    needs_own_context = any(
+        pytestconfig.getoption(option) != "off"
+        for option in ("--tracing", "--video", "--screenshot")
+    ) or request.node.get_closest_marker("browser_context_args")
+    if needs_own_context:
+        context = request.getfixturevalue("new_context")()
+        _block_static_assets(context)
+        yield context
+        return
+
+    context = request.getfixturevalue("_shared_context")
+    yield context
+    # Close this test's tabs so the next one starts from a clean context
+    for page in context.pages:
+        page.close()
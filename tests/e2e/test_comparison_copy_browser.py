@@ -17,6 +17,15 @@ def _field_prefix_selector(prefix: str, suffix: str) -> str:
     return f"[name^='{prefix}'][name$='{suffix}']"
 
 
+# Selectors shared by several tests
+_LEFT_TITLE = _field_selector("left_form_title")
+_LEFT_ENTRY_1_TITLE = _field_selector("left_form_entries_1_title")
+_RIGHT_NEW_ENTRY_TITLE = _field_prefix_selector("right_form_entries_new_", "_title")
+_RIGHT_NEW_NOTE_TEXT = _field_prefix_selector(
+    "right_form_entries_0_notes_new_", "_text"
+)
+
+
 def _fill(page, name: str, value: str) -> None:
     page.fill(_field_selector(name), value)
 
@@ -26,13 +35,10 @@ def _read_value(page, name: str) -> str:
 
 
 def _wait_for_value(page, selector: str, expected: str) -> None:
-    page.wait_for_function(
-        """(args) => {
-          const el = document.querySelector(args.selector);
-          return el && el.value === args.expected;
-        }""",
-        arg={"selector": selector, "expected": expected},
-    )
+    # Imported here so the module still collects when Playwright is absent
+    from playwright.sync_api import expect
+
+    expect(page.locator(selector).first).to_have_value(expected, timeout=5000)
 
 
 def _click_copy(page, path: str) -> None:
@@ -53,7 +59,7 @@ def _is_entry_open(page, form_name: str, idx: int) -> bool:
 
 def test_copy_scalar_field(page, app_server):
     page.goto(app_server)
-    page.wait_for_selector(_field_selector("left_form_title"))
+    page.wait_for_selector(_LEFT_TITLE)
 
     _fill(page, "left_form_title", "Updated Title")
     _click_copy(page, "title")
@@ -63,19 +69,12 @@ def test_copy_scalar_field(page, app_server):
 
 def test_copy_list_item_adds_and_copies(page, app_server):
     page.goto(app_server)
-    page.wait_for_selector(
-        _field_selector("left_form_entries_1_title"), state="attached"
-    )
+    page.wait_for_selector(_LEFT_ENTRY_1_TITLE, state="attached")
 
     _click_copy(page, "entries[1]")
 
-    page.wait_for_selector(
-        _field_prefix_selector("right_form_entries_new_", "_title"),
-        state="attached",
-    )
-    _wait_for_value(
-        page, _field_prefix_selector("right_form_entries_new_", "_title"), "Entry One"
-    )
+    page.wait_for_selector(_RIGHT_NEW_ENTRY_TITLE, state="attached")
+    _wait_for_value(page, _RIGHT_NEW_ENTRY_TITLE, "Entry One")
 
 
 def test_copy_nested_list_item_with_subfields(page, app_server):
@@ -87,15 +86,8 @@ def test_copy_nested_list_item_with_subfields(page, app_server):
     _open_entry_item(page, "left_form", 0)
     _click_copy(page, "entries[0].notes[0]")
 
-    page.wait_for_selector(
-        _field_prefix_selector("right_form_entries_0_notes_new_", "_text"),
-        state="attached",
-    )
-    _wait_for_value(
-        page,
-        _field_prefix_selector("right_form_entries_0_notes_new_", "_text"),
-        "Left Note A",
-    )
+    page.wait_for_selector(_RIGHT_NEW_NOTE_TEXT, state="attached")
+    _wait_for_value(page, _RIGHT_NEW_NOTE_TEXT, "Left Note A")
 
 
 def test_copy_pill_fields(page, app_server):
@@ -105,27 +97,27 @@ def test_copy_pill_fields(page, app_server):
     _click_copy(page, "labels")
 
     page.wait_for_selector("#right_form_labels_pills_container")
-    alpha = page.locator("#right_form_labels_pills_container span[data-value='Alpha']")
-    gamma = page.locator("#right_form_labels_pills_container span[data-value='Gamma']")
-    beta = page.locator("#right_form_labels_pills_container span[data-value='Beta']")
+    # Count all three pills in one round trip
+    counts = page.evaluate(
+        """() => {
+          const container = document.querySelector("#right_form_labels_pills_container");
+          const count = (value) =>
+            container.querySelectorAll(`span[data-value='${value}']`).length;
+          return { Alpha: count("Alpha"), Gamma: count("Gamma"), Beta: count("Beta") };
+        }"""
+    )
 
-    assert alpha.count() == 1
-    assert gamma.count() == 1
-    assert beta.count() == 0
+    assert counts == {"Alpha": 1, "Gamma": 1, "Beta": 0}
 
 
 def test_full_list_copy_aligns_lengths(page, app_server):
     page.goto(app_server)
-    page.wait_for_selector(
-        _field_selector("left_form_entries_1_title"), state="attached"
-    )
+    page.wait_for_selector(_LEFT_ENTRY_1_TITLE, state="attached")
 
     _click_copy(page, "entries")
 
     _wait_for_value(page, _field_selector("right_form_entries_0_title"), "Entry Zero")
-    _wait_for_value(
-        page, _field_prefix_selector("right_form_entries_new_", "_title"), "Entry One"
-    )
+    _wait_for_value(page, _RIGHT_NEW_ENTRY_TITLE, "Entry One")
 
 
 def test_accordion_state_preserved_on_copy(page, app_server):
@@ -143,7 +135,7 @@ def test_accordion_state_preserved_on_copy(page, app_server):
 
 def test_submit_after_copy_parses_new_items(page, app_server):
     page.goto(app_server)
-    page.wait_for_selector(_field_selector("left_form_title"))
+    page.wait_for_selector(_LEFT_TITLE)
 
     _fill(page, "left_form_title", "Submit Title")
 
@@ -153,26 +145,13 @@ def test_submit_after_copy_parses_new_items(page, app_server):
     _click_copy(page, "entries[0].notes[0]")
     _click_copy(page, "labels")
 
-    page.wait_for_selector(
-        _field_prefix_selector("right_form_entries_new_", "_title"),
-        state="attached",
-    )
-    _wait_for_value(
-        page, _field_prefix_selector("right_form_entries_new_", "_title"), "Entry One"
-    )
-    page.wait_for_selector(
-        _field_prefix_selector("right_form_entries_0_notes_new_", "_text"),
-        state="attached",
-    )
-    _wait_for_value(
-        page,
-        _field_prefix_selector("right_form_entries_0_notes_new_", "_text"),
-        "Left Note A",
-    )
+    page.wait_for_selector(_RIGHT_NEW_ENTRY_TITLE, state="attached")
+    _wait_for_value(page, _RIGHT_NEW_ENTRY_TITLE, "Entry One")
+    page.wait_for_selector(_RIGHT_NEW_NOTE_TEXT, state="attached")
+    _wait_for_value(page, _RIGHT_NEW_NOTE_TEXT, "Left Note A")
 
     page.locator("#comparison-form").evaluate("form => form.submit()")
     page.wait_for_url("**/submit", wait_until="domcontentloaded")
-    page.wait_for_selector("#submit-result", state="attached")
 
     payload = page.locator("#submit-result").inner_text()
     data = json.loads(payload)
@@ -6,79 +6,101 @@ pytestmark = [pytest.mark.e2e, pytest.mark.playwright]
 
 
 def _wait_for_value(page, selector: str, expected: str) -> None:
-    page.wait_for_function(
-        """(args) => {
-          const el = document.querySelector(args.selector);
-          return el && el.value === args.expected;
+    # Imported here so the module still collects when Playwright is absent
+    from playwright.sync_api import expect
+
+    expect(page.locator(selector)).to_have_value(expected, timeout=5000)
+
+
+def _fill_fields(page, fields: dict[str, str]) -> None:
+    # Set several already-rendered inputs in one round trip
+    page.evaluate(
+        """(fields) => {
+          for (const [selector, value] of Object.entries(fields)) {
+            const el = document.querySelector(selector);
+            if (el === null) {
+              throw new Error(`No element matches ${selector}`);
+            }
+            el.value = value;
+            el.dispatchEvent(new Event("input", { bubbles: true }));
+            el.dispatchEvent(new Event("change", { bubbles: true }));
+          }
         }""",
-        arg={"selector": selector, "expected": expected},
+        fields,
     )
 
 
+def _add_list_item(page, field: str, fields: dict[str, str]) -> None:
+    card = page.locator(f"#complex_form_complex_form_{field}_0_card")
+    card.locator(":scope > .uk-accordion-title").click()
+    card.locator(f"button[hx-post='/form/complex_form/list/add/{field}']").click()
+    for selector, value in fields.items():
+        page.locator(selector).first.fill(value)
+
+
 def test_complex_form_submit_success(page, complex_form_server):
     page.goto(complex_form_server)
-    page.wait_for_selector("[name='complex_form_name']", state="attached")
 
-    page.fill("[name='complex_form_name']", "Updated User")
-    page.fill("[name='complex_form_age']", "42")
-    page.fill("[name='complex_form_score']", "91.2")
+    _fill_fields(
+        page,
+        {
+            "[name='complex_form_name']": "Updated User",
+            "[name='complex_form_age']": "42",
+            "[name='complex_form_score']": "91.2",
+        },
+    )
 
     page.select_option("#complex_form_categories_pills_container_dropdown", "Beta")
     page.wait_for_selector(
         "#complex_form_categories_pills_container span[data-value='Beta']"
     )
 
-    page.locator("#complex_form_complex_form_tags_0_card > .uk-accordion-title").click()
-    page.locator(
-        "#complex_form_complex_form_tags_0_card button[hx-post='/form/complex_form/list/add/tags']"
-    ).click()
-    page.fill("[name^='complex_form_tags_new_']", "added-tag")
-
-    page.locator(
-        "#complex_form_complex_form_addresses_0_card > .uk-accordion-title"
-    ).click()
-    page.locator(
-        "#complex_form_complex_form_addresses_0_card button[hx-post='/form/complex_form/list/add/addresses']"
-    ).click()
-    new_street = page.locator(
-        "[name^='complex_form_addresses_new_'][name$='_street']"
-    ).first
-    new_street.fill("987 Elm St")
-    page.locator("[name^='complex_form_addresses_new_'][name$='_city']").first.fill(
-        "Dallas"
+    _add_list_item(
+        page, "tags", {"textarea[name^='complex_form_tags_new_']": "added-tag"}
     )
 
-    address_card = new_street.locator("xpath=ancestor::li[1]")
+    _add_list_item(
+        page,
+        "addresses",
+        {
+            "textarea[name^='complex_form_addresses_new_'][name$='_street']": (
+                "987 Elm St"
+            ),
+            "textarea[name^='complex_form_addresses_new_'][name$='_city']": "Dallas",
+        },
+    )
+
+    address_card = page.locator(
+        "li[id^='complex_form_complex_form_addresses_new_'][id$='_card']"
+    ).first
     address_card.locator("button[hx-post*='/tags']").first.click()
     page.fill(
-        "[name^='complex_form_addresses_new_'][name*='_tags_new_']",
+        "textarea[name^='complex_form_addresses_new_'][name*='_tags_new_']",
         "office",
     )
 
-    page.locator(
-        "#complex_form_complex_form_contacts_0_card > .uk-accordion-title"
-    ).click()
-    page.locator(
-        "#complex_form_complex_form_contacts_0_card button[hx-post='/form/complex_form/list/add/contacts']"
-    ).click()
-    new_contact = page.locator(
-        "[name^='complex_form_contacts_new_'][name$='_name']"
-    ).first
-    new_contact.fill("Sam Smith")
-    page.locator("[name^='complex_form_contacts_new_'][name$='_email']").first.fill(
-        "sam@example.com"
+    _add_list_item(
+        page,
+        "contacts",
+        {
+            "textarea[name^='complex_form_contacts_new_'][name$='_name']": "Sam Smith",
+            "textarea[name^='complex_form_contacts_new_'][name$='_email']": (
+                "sam@example.com"
+            ),
+        },
     )
 
-    contact_card = new_contact.locator("xpath=ancestor::li[1]")
+    contact_card = page.locator(
+        "li[id^='complex_form_complex_form_contacts_new_'][id$='_card']"
+    ).first
     contact_card.locator("button[hx-post*='/phones']").first.click()
     page.fill(
-        "[name^='complex_form_contacts_new_'][name*='_phones_new_']",
+        "textarea[name^='complex_form_contacts_new_'][name*='_phones_new_']",
         "555-0202",
     )
 
     page.locator("#complex-form").evaluate("form => form.submit()")
     page.wait_for_url("**/submit", wait_until="domcontentloaded")
-    page.wait_for_selector("#submit-result", state="attached")
 
     payload = page.locator("#submit-result").inner_text()
     data = json.loads(payload)
@@ -101,7 +123,6 @@ def test_complex_form_submit_success(page, complex_form_server):
 
 def test_complex_form_refresh_preserves_changes(page, complex_form_server):
     page.goto(complex_form_server)
-    page.wait_for_selector("[name='complex_form_name']", state="attached")
 
     page.fill("[name='complex_form_name']", "Refreshed User")
     page.locator("button[uk-tooltip^='Update the form display']").click()
@@ -111,7 +132,6 @@ def test_complex_form_refresh_preserves_changes(page, complex_form_server):
 
 def test_complex_form_reset_restores_initial_values(page, complex_form_server):
     page.goto(complex_form_server)
-    page.wait_for_selector("[name='complex_form_name']", state="attached")
 
     page.fill("[name='complex_form_name']", "Reset Me")
     page.once("dialog", lambda dialog: dialog.accept())
@@ -122,12 +142,10 @@ def test_complex_form_reset_restores_initial_values(page, complex_form_server):
 
 def test_complex_form_validation_error(page, complex_form_server):
     page.goto(complex_form_server)
-    page.wait_for_selector("[name='complex_form_age']", state="attached")
 
     page.fill("[name='complex_form_age']", "")
     page.locator("#complex-form").evaluate("form => form.submit()")
     page.wait_for_url("**/submit", wait_until="domcontentloaded")
-    page.wait_for_selector("#submit-result", state="attached")
 
     payload = page.locator("#submit-result").inner_text()
     assert "Input should be a valid integer" in payload
@@ -6,6 +6,14 @@ import re
 
 import pytest
 
+# Names of the inputs returned by the HTMX add-item routes, matched against the
+# raw response bytes so the body doesn't need decoding first
+_MAIN_TAG_NEW_RE = re.compile(
+    rb'name="(test_complex_nested_main_address_tags_new_[0-9]+)"'
+)
+_OPT_TAG_NEW_RE = re.compile(rb'name="(optional_list_form_optional_tags_new_[0-9]+)"')
+_REQ_TAG_NEW_RE = re.compile(rb'name="(optional_list_form_required_tags_new_[0-9]+)"')
+
 
 def get_base_form_data():
     """Return base form data with all required fields for ComplexNestedTestSchema."""
@@ -112,11 +120,9 @@ class TestNestedListWorkflow:
         assert add_response.status_code == 200
 
         # Extract the new field name from the response - account for form prefix
-        match = re.search(
-            r'name="(test_complex_nested_main_address_tags_new_\d+)"', add_response.text
-        )
+        match = _MAIN_TAG_NEW_RE.search(add_response.content)
         assert match is not None
-        new_tag_field = match.group(1)
+        new_tag_field = match.group(1).decode()
 
         # Now submit a form with both existing and new tags
         form_data = {
@@ -307,24 +313,26 @@ class TestNestedListWorkflow:
             # Main address
             "test_complex_nested_main_address_street": "Performance St",
             "test_complex_nested_main_address_city": "Performance City",
+            # Many nested tags; 20 should be reasonable for testing
+            **{
+                f"test_complex_nested_main_address_tags_{i}": f"perf_tag_{i}"
+                for i in range(20)
+            },
         }
 
-        # Add many nested tags
-        for i in range(20):  # 20 tags should be reasonable for testing
-            form_data[f"test_complex_nested_main_address_tags_{i}"] = f"perf_tag_{i}"
-
         # Add multiple other addresses with tags
         for addr_idx in range(3):
-            form_data[f"test_complex_nested_other_addresses_{addr_idx}_street"] = (
-                f"Addr {addr_idx} St"
-            )
-            form_data[f"test_complex_nested_other_addresses_{addr_idx}_city"] = (
-                f"City {addr_idx}"
+            prefix = f"test_complex_nested_other_addresses_{addr_idx}"
+            form_data.update(
+                {
+                    f"{prefix}_street": f"Addr {addr_idx} St",
+                    f"{prefix}_city": f"City {addr_idx}",
+                    **{
+                        f"{prefix}_tags_{tag_idx}": f"addr_{addr_idx}_tag_{tag_idx}"
+                        for tag_idx in range(5)
+                    },
+                }
             )
-            for tag_idx in range(5):
-                form_data[
-                    f"test_complex_nested_other_addresses_{addr_idx}_tags_{tag_idx}"
-                ] = f"addr_{addr_idx}_tag_{tag_idx}"
 
         response = complex_nested_client.post(
             "/submit_form", data=form_data, headers=htmx_headers
@@ -580,13 +588,9 @@ class TestOptionalListWorkflow:
         assert add_response.status_code == 200
 
         # Extract the new field name from the response
-        import re
-
-        match = re.search(
-            r'name="(optional_list_form_optional_tags_new_\d+)"', add_response.text
-        )
+        match = _OPT_TAG_NEW_RE.search(add_response.content)
         assert match is not None
-        new_field_name = match.group(1)
+        new_field_name = match.group(1).decode()
 
         # Now submit the form with the new field
         form_data = {
@@ -619,13 +623,9 @@ class TestOptionalListWorkflow:
         assert add_response.status_code == 200
 
         # Extract the new field name from the response
-        import re
-
-        match = re.search(
-            r'name="(optional_list_form_required_tags_new_\d+)"', add_response.text
-        )
+        match = _REQ_TAG_NEW_RE.search(add_response.content)
         assert match is not None
-        new_field_name = match.group(1)
+        new_field_name = match.group(1).decode()
 
         # Now submit the form with the new field
         form_data = {